@@ -8,6 +8,7 @@ Tracks consistency scores over time to detect:
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -99,7 +100,8 @@ class DriftDetector:
         unverified = 0
         confidence_sum = 0.0
         confidence_count = 0
-        category_scores: dict[str, list[float]] = {}
+        category_sums: dict[str, float] = defaultdict(float)
+        category_counts: Counter[str] = Counter()
         rules_with_consistency: list[str] = []
 
         for rule in rules:
@@ -122,19 +124,17 @@ class DriftDetector:
             confidence_sum += rule.consistency.summary.confidence
             confidence_count += 1
 
-            # Track category scores
+            # Track category scores as running totals
             for ev in rule.consistency.evidence:
-                if ev.category not in category_scores:
-                    category_scores[ev.category] = []
-                category_scores[ev.category].append(ev.score)
+                category_sums[ev.category] += ev.score
+                category_counts[ev.category] += 1
 
         avg_confidence = confidence_sum / confidence_count if confidence_count > 0 else 0.0
 
         # Average category scores
         avg_category_scores = {
-            cat: sum(scores) / len(scores)
-            for cat, scores in category_scores.items()
-            if scores
+            cat: score_sum / category_counts[cat]
+            for cat, score_sum in category_sums.items()
         }
 
         metrics = DriftMetrics(
@@ -177,12 +177,16 @@ class ErrorPatternAnalyzer:
         self,
         rules: list[Rule] | None = None,
         min_affected: int = 2,
+        include_samples: bool = True,
     ) -> list[ErrorPattern]:
         """Detect systematic error patterns.
 
         Args:
             rules: Rules to analyze.
             min_affected: Minimum rules affected to be considered a pattern.
+            include_samples: Whether to collect sample evidence for each pattern.
+                Each sample lookup rescans the rules, so callers that do not
+                display samples should pass False.
 
         Returns:
             List of detected error patterns.
@@ -205,7 +209,10 @@ class ErrorPatternAnalyzer:
                     severity="high" if stats.fail_rate > 0.3 else "medium",
                     affected_rule_count=stats.fail_count,
                     affected_rules=stats.affected_rules[:10],  # Limit
-                    sample_evidence=self._get_sample_evidence(rules, category, "fail"),
+                    sample_evidence=(
+                        self._get_sample_evidence(rules, category, "fail")
+                        if include_samples else []
+                    ),
                     recommendation=self._get_recommendation(category, "fail"),
                 ))
 
@@ -218,7 +225,10 @@ class ErrorPatternAnalyzer:
                     severity="medium" if stats.warning_rate > 0.3 else "low",
                     affected_rule_count=stats.warning_count,
                     affected_rules=stats.affected_rules[:10],
-                    sample_evidence=self._get_sample_evidence(rules, category, "warning"),
+                    sample_evidence=(
+                        self._get_sample_evidence(rules, category, "warning")
+                        if include_samples else []
+                    ),
                     recommendation=self._get_recommendation(category, "warning"),
                 ))
 
@@ -231,7 +241,10 @@ class ErrorPatternAnalyzer:
                     severity="medium",
                     affected_rule_count=stats.total,
                     affected_rules=stats.affected_rules[:10],
-                    sample_evidence=self._get_sample_evidence(rules, category, None),
+                    sample_evidence=(
+                        self._get_sample_evidence(rules, category, None)
+                        if include_samples else []
+                    ),
                     recommendation=f"Review {category} checks across all rules",
                 ))
 
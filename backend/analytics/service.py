@@ -11,7 +11,7 @@ Provides advanced analytics across rules using embeddings:
 from __future__ import annotations
 
 import math
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -79,6 +79,23 @@ def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     return dot_product / (norm1 * norm2)
 
 
+def _mean_pairwise_cosine(vectors: np.ndarray) -> float:
+    """Mean cosine similarity over all distinct pairs of row vectors.
+
+    Computes the full similarity matrix with one matrix product instead of
+    a Python loop over pairs. Zero vectors contribute a similarity of 0.0,
+    matching _cosine_similarity.
+    """
+    n = len(vectors)
+    if n < 2:
+        return 0.0
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = vectors / np.where(norms == 0, 1.0, norms)
+    similarities = unit @ unit.T
+    return float(similarities[np.triu_indices(n, k=1)].mean())
+
+
 class RuleAnalyticsService:
     """Central service for rule comparison and clustering analytics.
 
@@ -426,14 +443,7 @@ class RuleAnalyticsService:
             # Calculate cohesion (average pairwise similarity)
             cluster_vectors = X[cluster_mask]
             if len(cluster_vectors) > 1:
-                similarities = []
-                for i in range(len(cluster_vectors)):
-                    for j in range(i + 1, len(cluster_vectors)):
-                        sim = _cosine_similarity(
-                            cluster_vectors[i].tolist(), cluster_vectors[j].tolist()
-                        )
-                        similarities.append(sim)
-                cohesion = np.mean(similarities) if similarities else 0.0
+                cohesion = _mean_pairwise_cosine(cluster_vectors)
             else:
                 cohesion = 1.0
 
@@ -534,20 +544,16 @@ class RuleAnalyticsService:
                     if conflict:
                         conflicts.append(conflict)
 
-        # Count by severity
-        high_count = sum(1 for c in conflicts if c.severity == ConflictSeverity.HIGH)
-        medium_count = sum(
-            1 for c in conflicts if c.severity == ConflictSeverity.MEDIUM
-        )
-        low_count = sum(1 for c in conflicts if c.severity == ConflictSeverity.LOW)
+        # Count by severity in one pass
+        severity_counts = Counter(c.severity for c in conflicts)
 
         return ConflictReport(
             total_rules_analyzed=len(rule_ids),
             conflicts_found=len(conflicts),
             conflicts=conflicts,
-            high_severity_count=high_count,
-            medium_severity_count=medium_count,
-            low_severity_count=low_count,
+            high_severity_count=severity_counts[ConflictSeverity.HIGH],
+            medium_severity_count=severity_counts[ConflictSeverity.MEDIUM],
+            low_severity_count=severity_counts[ConflictSeverity.LOW],
         )
 
     def _check_conflict_pair(
@@ -9,6 +9,8 @@ These endpoints are for internal use by the KE team:
 
 from __future__ import annotations
 
+from collections import Counter
+
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import Any
@@ -22,6 +24,7 @@ from backend.rules import (
     ConsistencyBlock,
     ConsistencySummary,
     ConsistencyEvidence,
+    count_evidence_labels,
 )
 from backend.verification import ConsistencyEngine, verify_rule
 from backend.analytics import ErrorPatternAnalyzer, DriftDetector
@@ -61,6 +64,9 @@ class VerifyRuleResponse(BaseModel):
     status: str
     confidence: float
     evidence_count: int
+    pass_count: int = 0
+    fail_count: int = 0
+    warning_count: int = 0
     evidence: list[dict]
 
 
@@ -194,6 +200,9 @@ def verify_rule_endpoint(request: VerifyRuleRequest):
         status=result.summary.status.value,
         confidence=result.summary.confidence,
         evidence_count=len(result.evidence),
+        pass_count=result.summary.pass_count,
+        fail_count=result.summary.fail_count,
+        warning_count=result.summary.warning_count,
         evidence=[
             {
                 "tier": ev.tier,
@@ -221,11 +230,14 @@ def verify_all_rules(
     rules = loader.get_all_rules()
 
     results = []
+    status_counts: Counter[str] = Counter()
     for rule in rules:
         consistency = engine.verify_rule(rule, tiers=tiers)
+        status = consistency.summary.status.value
+        status_counts[status] += 1
         results.append({
             "rule_id": rule.rule_id,
-            "status": consistency.summary.status.value,
+            "status": status,
             "confidence": consistency.summary.confidence,
         })
 
@@ -235,9 +247,9 @@ def verify_all_rules(
 
     return {
         "total": len(results),
-        "verified": sum(1 for r in results if r["status"] == "verified"),
-        "needs_review": sum(1 for r in results if r["status"] == "needs_review"),
-        "inconsistent": sum(1 for r in results if r["status"] == "inconsistent"),
+        "verified": status_counts["verified"],
+        "needs_review": status_counts["needs_review"],
+        "inconsistent": status_counts["inconsistent"],
         "results": results,
     }
 
@@ -259,7 +271,7 @@ def get_analytics_summary():
 def get_error_patterns(min_affected: int = Query(default=2)):
     """Detect error patterns across rules."""
     analyzer = get_analyzer()
-    patterns = analyzer.detect_patterns(min_affected=min_affected)
+    patterns = analyzer.detect_patterns(min_affected=min_affected, include_samples=False)
 
     return [
         ErrorPatternResponse(
@@ -487,9 +499,13 @@ def submit_human_review(rule_id: str, request: HumanReviewRequest):
         new_confidence = score
 
     # Create updated consistency block
+    pass_count, fail_count, warning_count = count_evidence_labels(existing_evidence)
     new_summary = ConsistencySummary(
         status=new_status,
         confidence=round(new_confidence, 4),
+        pass_count=pass_count,
+        fail_count=fail_count,
+        warning_count=warning_count,
         last_verified=timestamp,
         verified_by=f"human:{request.reviewer_id}",
         notes=request.notes,
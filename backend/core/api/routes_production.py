@@ -284,6 +284,8 @@ async def compile_all_rules(optimize: bool = Query(default=True)) -> CompileAllR
     """
     repo = get_rule_repo()
     rules = load_rules_from_db(repo)
+    # One query for all source YAML instead of a lookup per rule
+    yaml_by_id = {record.rule_id: record.content_yaml for record in repo.get_all_rules()}
 
     compiler = RuleCompiler()
     runtime = get_runtime()
@@ -293,8 +295,7 @@ async def compile_all_rules(optimize: bool = Query(default=True)) -> CompileAllR
 
     for rule_id, rule in rules.items():
         try:
-            record = repo.get_rule(rule_id)
-            yaml_content = record.content_yaml if record else None
+            yaml_content = yaml_by_id.get(rule_id)
 
             ir = compiler.compile(rule, yaml_content)
 
@@ -1,5 +1,6 @@
 """Application configuration and feature flags."""
 
+import importlib.util
 import os
 from functools import lru_cache
 from pydantic_settings import BaseSettings
@@ -30,7 +31,16 @@ def get_settings() -> Settings:
 
 
 def ml_available() -> bool:
-    """Check if ML dependencies are installed."""
+    """Check if ML dependencies are installed and importable.
+
+    The import is only attempted when both packages are present, so the
+    common no-ML case never loads torch.
+    """
+    if not all(
+        importlib.util.find_spec(name) is not None
+        for name in ("sentence_transformers", "chromadb")
+    ):
+        return False
     try:
         import sentence_transformers  # noqa: F401
         import chromadb  # noqa: F401
@@ -118,8 +118,9 @@ def build_rulebook_outline(rules: list[Rule]) -> dict:
         })
 
     # Add any documents with rules but not in legal corpus
+    legal_doc_ids = {d.document_id for d in legal_docs}
     for doc_id, articles_map in rule_coverage.items():
-        if not any(d.document_id == doc_id for d in legal_docs):
+        if doc_id not in legal_doc_ids:
             article_children = []
             total_rules = 0
             for article_num, article_rules in sorted(articles_map.items()):
@@ -221,6 +221,18 @@ def render_corpus_links_html(tree_data: dict) -> str:
         return f'<div style="color: red; padding: 20px;">Error rendering chart: {_escape(str(e))}</div>'
 
 
+# Coverage status -> (CSS class, badge HTML), built once at import
+_COVERAGE_STATUS_STYLES: dict[str, tuple[str, str]] = {
+    status: (css_class, f'<span class="coverage-badge {css_class}">{icon}</span>')
+    for status, css_class, icon in (
+        ("covered", "coverage-covered", "&#x2714;"),  # Checkmark
+        ("gap", "coverage-gap", "&#x26A0;"),  # Warning
+        ("unknown", "", ""),
+    )
+}
+_COVERAGE_STATUS_STYLES[""] = ("", "")
+
+
 def _render_coverage_node(node: dict, depth: int = 0) -> str:
     """Render a coverage node with status-based styling."""
     title = _escape(node.get("title", "Node"))
@@ -228,16 +240,10 @@ def _render_coverage_node(node: dict, depth: int = 0) -> str:
     status = node.get("status", "")
     node_id = f"cov_{id(node)}_{depth}"
 
-    # Determine status color
-    if status == "covered":
-        status_class = "coverage-covered"
-        status_icon = "&#x2714;"  # Checkmark
-    elif status == "gap":
-        status_class = "coverage-gap"
-        status_icon = "&#x26A0;"  # Warning
-    else:
-        status_class = ""
-        status_icon = ""
+    # Determine status class and badge
+    status_class, status_badge = _COVERAGE_STATUS_STYLES.get(
+        status or "", _COVERAGE_STATUS_STYLES["unknown"]
+    )
 
     # Collect metadata
     metadata = []
@@ -248,9 +254,6 @@ def _render_coverage_node(node: dict, depth: int = 0) -> str:
 
     meta_html = " ".join(metadata) if metadata else ""
 
-    # Status badge
-    status_badge = f'<span class="coverage-badge {status_class}">{status_icon}</span>' if status else ""
-
     if children:
         # Branch node
         children_html = "\n".join(_render_coverage_node(child, depth + 1) for child in children)
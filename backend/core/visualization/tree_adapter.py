@@ -19,9 +19,37 @@ from backend.rules import (
     ConsistencyBlock,
     ConsistencyEvidence,
     ConsistencyStatus,
+    count_evidence_labels,
 )
 
 
+# Maximum length of TreeNode.short_label
+SHORT_LABEL_LENGTH = 15
+
+# Status styling lookups (fallbacks match "unverified")
+_STATUS_COLORS = {
+    "verified": "#28a745",      # green
+    "needs_review": "#ffc107",  # yellow/amber
+    "inconsistent": "#dc3545",  # red
+    "unverified": "#6c757d",    # gray
+}
+_STATUS_EMOJI = {
+    "verified": "✓",
+    "needs_review": "?",
+    "inconsistent": "✗",
+    "unverified": "○",
+}
+_STATUS_BORDER_COLORS = {
+    "verified": "#1e7e34",
+    "needs_review": "#d39e00",
+    "inconsistent": "#bd2130",
+    "unverified": "#545b62",
+}
+_DEFAULT_COLOR = _STATUS_COLORS["unverified"]
+_DEFAULT_EMOJI = _STATUS_EMOJI["unverified"]
+_DEFAULT_BORDER_COLOR = _STATUS_BORDER_COLORS["unverified"]
+
+
 # =============================================================================
 # Data Classes for Graph Representation
 # =============================================================================
@@ -41,32 +69,17 @@ class NodeConsistencyInfo:
     @property
     def color(self) -> str:
         """Get color for visualization based on status."""
-        return {
-            "verified": "#28a745",      # green
-            "needs_review": "#ffc107",  # yellow/amber
-            "inconsistent": "#dc3545",  # red
-            "unverified": "#6c757d",    # gray
-        }.get(self.status, "#6c757d")
+        return _STATUS_COLORS.get(self.status, _DEFAULT_COLOR)
 
     @property
     def emoji(self) -> str:
         """Get emoji indicator for status."""
-        return {
-            "verified": "✓",
-            "needs_review": "?",
-            "inconsistent": "✗",
-            "unverified": "○",
-        }.get(self.status, "○")
+        return _STATUS_EMOJI.get(self.status, _DEFAULT_EMOJI)
 
     @property
     def border_color(self) -> str:
         """Get border color (darker variant) for visualization."""
-        return {
-            "verified": "#1e7e34",
-            "needs_review": "#d39e00",
-            "inconsistent": "#bd2130",
-            "unverified": "#545b62",
-        }.get(self.status, "#545b62")
+        return _STATUS_BORDER_COLORS.get(self.status, _DEFAULT_BORDER_COLOR)
 
 
 @dataclass
@@ -94,6 +107,15 @@ class TreeNode:
     depth: int = 0
     position: int = 0
 
+    # Compact label for node pickers (leaf decision or node ID, truncated)
+    short_label: str = ""
+
+    def __post_init__(self) -> None:
+        """Derive short_label from the leaf decision or node ID when not given."""
+        if not self.short_label:
+            source = self.decision if self.node_type == "leaf" and self.decision else self.id
+            self.short_label = source[:SHORT_LABEL_LENGTH]
+
 
 @dataclass
 class TreeEdge:
@@ -261,9 +283,13 @@ class TreeGraph:
     def to_mermaid(self, show_consistency: bool = True) -> str:
         """Generate Mermaid flowchart format string."""
         lines = ["flowchart TD"]
+        style_lines: list[str] = []
 
-        # Node definitions with styling
+        # Node definitions, collecting styling in the same pass
         for node in self.nodes:
+            if show_consistency:
+                style_lines.append(f'    style {node.id} fill:{node.consistency.color}')
+
             if node.node_type == "leaf":
                 # Rounded rectangle for leaves
                 if node.decision:
@@ -287,9 +313,7 @@ class TreeGraph:
         # Add styling
         if show_consistency:
             lines.append("")
-            for node in self.nodes:
-                color = node.consistency.color.replace("#", "")
-                lines.append(f'    style {node.id} fill:#{color}')
+            lines.extend(style_lines)
 
         return "\n".join(lines)
 
@@ -357,15 +381,11 @@ class TreeAdapter:
         if rule.consistency:
             graph.overall_status = rule.consistency.summary.status.value
             graph.overall_confidence = rule.consistency.summary.confidence
-            graph.total_pass = sum(
-                1 for e in rule.consistency.evidence if e.label == "pass"
-            )
-            graph.total_fail = sum(
-                1 for e in rule.consistency.evidence if e.label == "fail"
-            )
-            graph.total_warning = sum(
-                1 for e in rule.consistency.evidence if e.label == "warning"
-            )
+            (
+                graph.total_pass,
+                graph.total_fail,
+                graph.total_warning,
+            ) = count_evidence_labels(rule.consistency.evidence)
 
         return graph
 
@@ -13,6 +13,7 @@ Falls back to simple hash-based vectors when ML is unavailable.
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -26,15 +27,10 @@ if TYPE_CHECKING:
 # Default embedding dimension
 DEFAULT_DIM = 384
 
-# Try to load sentence-transformers
+# Check for sentence-transformers without importing it; the import pulls in
+# torch, so it is deferred until get_encoder() is first called.
 _encoder: "SentenceTransformer | None" = None
-_ml_available = False
-
-try:
-    from sentence_transformers import SentenceTransformer
-    _ml_available = True
-except ImportError:
-    pass
+_ml_available = importlib.util.find_spec("sentence_transformers") is not None
 
 
 def ml_available() -> bool:
@@ -44,11 +40,16 @@ def ml_available() -> bool:
 
 def get_encoder() -> "SentenceTransformer":
     """Get or create the sentence transformer encoder."""
-    global _encoder
+    global _encoder, _ml_available
     if _encoder is None:
         if not _ml_available:
             raise RuntimeError("sentence-transformers not installed")
-        from sentence_transformers import SentenceTransformer
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            # Installed but broken (e.g. torch mismatch): treat as unavailable
+            _ml_available = False
+            raise
         _encoder = SentenceTransformer("all-MiniLM-L6-v2")
     return _encoder
 
@@ -274,7 +275,12 @@ class EmbeddingGenerator:
         Uses ML encoder if available, otherwise falls back to hash-based vector.
         """
         if self.use_ml:
-            return self._encode_ml(text)
+            try:
+                return self._encode_ml(text)
+            except ImportError:
+                # sentence-transformers is installed but could not be imported
+                self.use_ml = False
+                self.model_name = "hash-fallback"
         return self._encode_hash(text)
 
     def _encode_ml(self, text: str) -> list[float]:
@@ -10,8 +10,10 @@ These helpers do NOT use external LLMs - only local retrieval.
 
 from __future__ import annotations
 
+import copy
 import re
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 from backend.rules import RuleLoader, Rule
@@ -94,6 +96,12 @@ class SearchResult:
 
 _rule_loader: RuleLoader | None = None
 _context_retriever: RuleContextRetriever | None = None
+_source_index: tuple[int, dict[tuple[str, str | None], list[str]]] | None = None
+
+# Memoized helper results, valid for one rule loader version
+_cache_version: int | None = None
+_rule_context_cache: dict[str, RuleContextPayload | None] = {}
+_related_cache: dict[tuple[str, float, int], list[RelatedProvision]] = {}
 
 
 def _get_rule_loader() -> RuleLoader:
@@ -145,6 +153,32 @@ def _get_context_retriever() -> RuleContextRetriever:
     return _context_retriever
 
 
+def _get_source_index() -> dict[tuple[str, str | None], list[str]]:
+    """Get the map from (document_id, normalized article) to rule_ids.
+
+    The map is rebuilt only when the rule loader's version changes.
+    """
+    global _source_index
+    loader = _get_rule_loader()
+    if _source_index is None or _source_index[0] != loader.version:
+        index: dict[tuple[str, str | None], list[str]] = {}
+        for r in loader.get_all_rules():
+            if r.source:
+                key = (r.source.document_id, _normalize_article(r.source.article))
+                index.setdefault(key, []).append(r.rule_id)
+        _source_index = (loader.version, index)
+    return _source_index[1]
+
+
+def _sync_result_caches(loader: RuleLoader) -> None:
+    """Drop memoized context/related results if the rules have changed."""
+    global _cache_version
+    if _cache_version != loader.version:
+        _rule_context_cache.clear()
+        _related_cache.clear()
+        _cache_version = loader.version
+
+
 # =============================================================================
 # Article Pattern Matching
 # =============================================================================
@@ -208,15 +242,27 @@ def _normalize_article(article: str | None) -> str | None:
 def get_rule_context(rule_id: str) -> RuleContextPayload | None:
     """Get context payload for a rule.
 
+    Results are memoized until the rule loader's version changes. Each call
+    returns its own copy, so callers may mutate the payload freely.
+
     Args:
         rule_id: The rule ID to get context for.
 
     Returns:
         RuleContextPayload or None if rule not found.
     """
+    loader = _get_rule_loader()
+    _sync_result_caches(loader)
+
+    if rule_id not in _rule_context_cache:
+        _rule_context_cache[rule_id] = _build_rule_context(loader, rule_id)
+    return copy.deepcopy(_rule_context_cache[rule_id])
+
+
+def _build_rule_context(loader: RuleLoader, rule_id: str) -> RuleContextPayload | None:
+    """Build the context payload for a rule (uncached)."""
     from .corpus_loader import load_legal_document, LegalCorpusError
 
-    loader = _get_rule_loader()
     rule = loader.get_rule(rule_id)
 
     if rule is None:
@@ -274,7 +320,7 @@ def get_rule_context(rule_id: str) -> RuleContextPayload | None:
 
         # Additional passages can be before/after context
         # (In practice, we don't have true ordering, so we split them)
-        for i, passage in enumerate(context.source_passages[1:], start=1):
+        for i, passage in enumerate(islice(context.source_passages, 1, None), start=1):
             if i <= 2:
                 before_paragraphs.append(passage.text)
             else:
@@ -308,6 +354,8 @@ def get_related_provisions(
     """Get provisions related to a rule with filtering.
 
     Applies structural filter (same document_id) and similarity threshold.
+    Results are memoized like get_rule_context, and each call returns its
+    own copy.
 
     Args:
         rule_id: The rule to find related provisions for.
@@ -318,22 +366,27 @@ def get_related_provisions(
         List of RelatedProvision, empty if none above threshold.
     """
     loader = _get_rule_loader()
+    _sync_result_caches(loader)
+
+    key = (rule_id, threshold, limit)
+    if key not in _related_cache:
+        _related_cache[key] = _build_related_provisions(loader, rule_id, threshold, limit)
+    return copy.deepcopy(_related_cache[key])
+
+
+def _build_related_provisions(
+    loader: RuleLoader,
+    rule_id: str,
+    threshold: float,
+    limit: int,
+) -> list[RelatedProvision]:
+    """Build related provisions for a rule (uncached)."""
     rule = loader.get_rule(rule_id)
 
     if rule is None:
         return []
 
     retriever = _get_context_retriever()
-    all_rules = loader.get_all_rules()
-
-    # Build a map from (document_id, article) to rule_ids
-    source_to_rules: dict[tuple[str, str | None], list[str]] = {}
-    for r in all_rules:
-        if r.source:
-            key = (r.source.document_id, _normalize_article(r.source.article))
-            if key not in source_to_rules:
-                source_to_rules[key] = []
-            source_to_rules[key].append(r.rule_id)
 
     # Get related rules using existing logic
     related_rules = retriever.find_related_rules(rule, top_k=limit * 2)
@@ -493,17 +546,9 @@ def _search_semantic(query: str, max_hits: int) -> SearchResult:
         SearchResult with mode="semantic" and semantic hits.
     """
     retriever = _get_context_retriever()
-    loader = _get_rule_loader()
-    all_rules = loader.get_all_rules()
 
-    # Build a map from (document_id, normalized_article) to rule_ids
-    source_to_rules: dict[tuple[str, str | None], list[str]] = {}
-    for r in all_rules:
-        if r.source:
-            key = (r.source.document_id, _normalize_article(r.source.article))
-            if key not in source_to_rules:
-                source_to_rules[key] = []
-            source_to_rules[key].append(r.rule_id)
+    # Map from (document_id, normalized_article) to rule_ids
+    source_to_rules = _get_source_index()
 
     # Search using the retriever
     results = retriever._retriever.search(query, top_k=max_hits, method="bm25")
@@ -8,7 +8,9 @@ This module provides internal RAG functionality specifically for:
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 
 from backend.rules import Rule, RuleLoader
@@ -57,6 +59,8 @@ class RuleContextRetriever:
         self._retriever = retriever or Retriever(use_vectors=False)
         self._rule_loader = rule_loader
         self._indexed_documents: set[str] = set()
+        # (loader version, rule_id -> (tag set, description word set))
+        self._rule_features: tuple[int, dict[str, tuple[frozenset[str], frozenset[str]]]] | None = None
 
     def index_document(
         self,
@@ -248,11 +252,14 @@ class RuleContextRetriever:
             return []
 
         all_rules = self._rule_loader.get_all_rules()
+        features = self._get_rule_features(all_rules, self._rule_loader.version)
+        rule_tags, rule_words = _rule_feature_sets(rule)
         scored_rules: list[tuple[Rule, float]] = []
 
         for other in all_rules:
             if other.rule_id == rule.rule_id:
                 continue
+            other_tags, other_words = features.get(other.rule_id) or _rule_feature_sets(other)
 
             score = 0.0
 
@@ -266,23 +273,41 @@ class RuleContextRetriever:
                         score += 3.0
 
             # Overlapping tags
-            if rule.tags and other.tags:
-                overlap = len(set(rule.tags) & set(other.tags))
+            if rule_tags and other_tags:
+                overlap = len(rule_tags & other_tags)
                 score += overlap * 0.5
 
             # Similar description keywords
-            if rule.description and other.description:
-                rule_words = set(rule.description.lower().split())
-                other_words = set(other.description.lower().split())
+            if rule_words and other_words:
                 common = len(rule_words & other_words)
                 score += common * 0.2
 
             if score > 0:
                 scored_rules.append((other, score))
 
-        # Sort by score and return top_k
-        scored_rules.sort(key=lambda x: x[1], reverse=True)
-        return [r for r, _ in scored_rules[:top_k]]
+        # Select top_k by score without sorting every candidate
+        return [r for r, _ in heapq.nlargest(top_k, scored_rules, key=itemgetter(1))]
+
+    def _get_rule_features(
+        self,
+        rules: list[Rule],
+        version: int,
+    ) -> dict[str, tuple[frozenset[str], frozenset[str]]]:
+        """Get tag and description word sets for all loaded rules.
+
+        Computed once per rule loader version so related-rule scoring does
+        not re-tokenize every description for every query.
+
+        Args:
+            rules: All rules from the loader.
+            version: The loader's current version.
+        """
+        if self._rule_features is None or self._rule_features[0] != version:
+            self._rule_features = (
+                version,
+                {r.rule_id: _rule_feature_sets(r) for r in rules},
+            )
+        return self._rule_features[1]
 
     def get_rule_context(self, rule: Rule) -> RuleContext:
         """Get complete context for a rule.
@@ -322,3 +347,10 @@ class RuleContextRetriever:
     def __len__(self) -> int:
         """Return number of chunks indexed."""
         return len(self._retriever)
+
+
+def _rule_feature_sets(rule: Rule) -> tuple[frozenset[str], frozenset[str]]:
+    """Return a rule's tag set and lowercased description word set."""
+    tags = frozenset(rule.tags) if rule.tags else frozenset()
+    words = frozenset(rule.description.lower().split()) if rule.description else frozenset()
+    return tags, words
@@ -1,7 +1,10 @@
 """RAG service layer - chunking, indexing, retrieval, and generation."""
 
+import heapq
 import re
 from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
 
 from rank_bm25 import BM25Okapi
 
@@ -211,10 +214,8 @@ class BM25Index:
         query_tokens = self._tokenize(query)
         scores = self._index.get_scores(query_tokens)
 
-        # Get top-k results
-        indexed_scores = list(enumerate(scores))
-        indexed_scores.sort(key=lambda x: x[1], reverse=True)
-        top_results = indexed_scores[:top_k]
+        # Get top-k results (partial selection; same order as a stable full sort)
+        top_results = heapq.nlargest(top_k, enumerate(scores), key=itemgetter(1))
 
         results = []
         for idx, score in top_results:
@@ -530,7 +531,7 @@ class AnswerGenerator:
     ) -> str:
         """Generate answer from excerpts when no LLM available."""
         excerpts = []
-        for result in context[:3]:  # Top 3 results
+        for result in islice(context, 3):  # Top 3 results
             text = result.text[:300]
             if len(result.text) > 300:
                 text += "..."
@@ -32,6 +32,7 @@ from .service import (
     ConsistencyEvidence,
     ConsistencySummary,
     ConsistencyBlock,
+    count_evidence_labels,
     Rule,
     RulePack,
     TraceStep,
@@ -100,6 +101,7 @@ __all__ = [
     "ConsistencyEvidence",
     "ConsistencySummary",
     "ConsistencyBlock",
+    "count_evidence_labels",
     "Rule",
     "RulePack",
     "TraceStep",
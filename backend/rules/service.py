@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import date, datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from backend.core.ontology.jurisdiction import JurisdictionCode
 from backend.core.ontology.scenario import Scenario
@@ -161,6 +162,12 @@ class ConsistencyEvidence(BaseModel):
         description="ISO 8601 timestamp",
     )
 
+    @field_validator("label")
+    @classmethod
+    def intern_label(cls, v: str) -> str:
+        """Intern label so equality checks against literals hit the identity fast path."""
+        return sys.intern(v)
+
 
 class ConsistencySummary(BaseModel):
     """Summary of consistency verification results."""
@@ -169,6 +176,9 @@ class ConsistencySummary(BaseModel):
         default=ConsistencyStatus.UNVERIFIED, description="Overall verification status"
     )
     confidence: float = Field(default=0.0, ge=0.0, le=1.0, description="Weighted confidence score")
+    pass_count: int = Field(default=0, ge=0, description="Number of 'pass' evidence items")
+    fail_count: int = Field(default=0, ge=0, description="Number of 'fail' evidence items")
+    warning_count: int = Field(default=0, ge=0, description="Number of 'warning' evidence items")
     last_verified: str | None = Field(None, description="ISO 8601 timestamp")
     verified_by: str | None = Field(None, description="'system' or 'human:username'")
     notes: str | None = Field(None, description="Optional reviewer notes")
@@ -181,6 +191,24 @@ class ConsistencyBlock(BaseModel):
     evidence: list[ConsistencyEvidence] = Field(default_factory=list)
 
 
+def count_evidence_labels(evidence: list[ConsistencyEvidence]) -> tuple[int, int, int]:
+    """Count pass/fail/warning labels in a single pass over evidence.
+
+    Returns:
+        Tuple of (pass_count, fail_count, warning_count).
+    """
+    pass_count = fail_count = warning_count = 0
+    for ev in evidence:
+        label = ev.label
+        if label == "pass":
+            pass_count += 1
+        elif label == "fail":
+            fail_count += 1
+        elif label == "warning":
+            warning_count += 1
+    return pass_count, fail_count, warning_count
+
+
 # =============================================================================
 # Rule Model
 # =============================================================================
@@ -288,6 +316,16 @@ class RuleLoader:
     def __init__(self, rules_dir: str | Path | None = None):
         self.rules_dir = Path(rules_dir) if rules_dir else None
         self._rules: dict[str, Rule] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the loaded rule set changes.
+
+        Callers can key derived indexes on this to avoid rebuilding them
+        while the rules are unchanged.
+        """
+        return self._version
 
     def load_file(self, path: str | Path) -> list[Rule]:
         """Load rules from a single YAML file."""
@@ -309,6 +347,7 @@ class RuleLoader:
             rules.append(rule)
             self._rules[rule.rule_id] = rule
 
+        self._version += 1
         return rules
 
     def load_directory(self, path: str | Path | None = None) -> list[Rule]:
@@ -370,13 +409,6 @@ class RuleLoader:
     def _parse_consistency(self, data: dict) -> ConsistencyBlock:
         """Parse a consistency block."""
         summary_data = data.get("summary", {})
-        summary = ConsistencySummary(
-            status=ConsistencyStatus(summary_data.get("status", "unverified")),
-            confidence=summary_data.get("confidence", 0.0),
-            last_verified=summary_data.get("last_verified"),
-            verified_by=summary_data.get("verified_by"),
-            notes=summary_data.get("notes"),
-        )
 
         evidence = []
         for ev_data in data.get("evidence", []):
@@ -393,6 +425,18 @@ class RuleLoader:
                 )
             )
 
+        pass_count, fail_count, warning_count = count_evidence_labels(evidence)
+        summary = ConsistencySummary(
+            status=ConsistencyStatus(summary_data.get("status", "unverified")),
+            confidence=summary_data.get("confidence", 0.0),
+            pass_count=pass_count,
+            fail_count=fail_count,
+            warning_count=warning_count,
+            last_verified=summary_data.get("last_verified"),
+            verified_by=summary_data.get("verified_by"),
+            notes=summary_data.get("notes"),
+        )
+
         return ConsistencyBlock(summary=summary, evidence=evidence)
 
     def _parse_condition_group(self, data: dict) -> ConditionGroupSpec:
@@ -494,6 +538,7 @@ class RuleLoader:
             yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
         self._rules[rule.rule_id] = rule
+        self._version += 1
         return path
 
     def _rule_to_dict(self, rule: Rule) -> dict:
@@ -511,6 +556,7 @@ class RuleLoader:
 
         updated_rule = Rule(**rule_data)
         self._rules[rule_id] = updated_rule
+        self._version += 1
 
         return updated_rule
 
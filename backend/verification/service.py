@@ -20,6 +20,7 @@ from backend.rules import (
     ConsistencySummary,
     ConsistencyEvidence,
     ConsistencyStatus,
+    count_evidence_labels,
 )
 
 
@@ -839,9 +840,10 @@ def compute_summary(evidence: list[ConsistencyEvidence]) -> ConsistencySummary:
         )
 
     # Status determination
-    if any(e.label == "fail" for e in evidence):
+    pass_count, fail_count, warning_count = count_evidence_labels(evidence)
+    if fail_count:
         status = ConsistencyStatus.INCONSISTENT
-    elif any(e.label == "warning" for e in evidence):
+    elif warning_count:
         status = ConsistencyStatus.NEEDS_REVIEW
     else:
         status = ConsistencyStatus.VERIFIED
@@ -858,6 +860,9 @@ def compute_summary(evidence: list[ConsistencyEvidence]) -> ConsistencySummary:
     return ConsistencySummary(
         status=status,
         confidence=round(confidence, 4),
+        pass_count=pass_count,
+        fail_count=fail_count,
+        warning_count=warning_count,
         last_verified=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         verified_by="system",
     )
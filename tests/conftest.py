@@ -1,13 +1,28 @@
 """Pytest fixtures for test suite."""
 
+import random
+
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
+from fastapi.testclient import TestClient
+
 from backend.core.ontology import Scenario
 from backend.rules import RuleLoader, DecisionEngine
 from backend.rag import Retriever, BM25Index
 
+# Try to import orjson for faster response decoding (optional)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 
 # =============================================================================
 # Core Fixtures
@@ -34,6 +49,29 @@ def decision_engine(rule_loader: RuleLoader) -> DecisionEngine:
     return DecisionEngine(rule_loader)
 
 
+@pytest.fixture(scope="session")
+def client(tmp_path_factory: pytest.TempPathFactory):
+    """Test client for the FastAPI app, shared across the session.
+
+    Entered as a context manager so the app's startup (database init) runs
+    once, against a temporary database rather than the project data dir.
+    """
+    from backend.main import app
+    from backend.storage import set_db_path
+
+    set_db_path(tmp_path_factory.mktemp("db") / "ke_workbench.db")
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def read_json():
+    """Decode a response body, using orjson when it is installed."""
+    def _read(response) -> Any:
+        return _json_loads(response.content)
+    return _read
+
+
 @pytest.fixture
 def sample_scenario() -> Scenario:
     """Sample scenario for testing."""
@@ -145,47 +183,91 @@ def synthetic_verification() -> list[dict[str, Any]]:
     return VerificationGenerator(seed=42).generate(count=200)
 
 
+@pytest.fixture(scope="session")
+def ontology_sets() -> SimpleNamespace:
+    """Frozenset views of the synthetic data ontology lists for O(1) membership."""
+    from backend.synthetic_data.config import (
+        INSTRUMENT_TYPES,
+        ACTIVITY_TYPES,
+        JURISDICTIONS,
+        VERIFICATION_TIERS,
+    )
+    return SimpleNamespace(
+        instruments=frozenset(INSTRUMENT_TYPES),
+        activities=frozenset(ACTIVITY_TYPES),
+        jurisdictions=frozenset(JURISDICTIONS),
+        tiers=frozenset(VERIFICATION_TIERS),
+    )
+
+
 # =============================================================================
 # Scenario Category Fixtures
+#
+# Derived fixtures are session-scoped filtered views of the session-scoped
+# synthetic datasets above; tests must treat them as read-only.
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def happy_path_scenarios(synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to only happy path scenarios."""
     return [s for s in synthetic_scenarios if s.get("category") == "happy_path"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def edge_case_scenarios(synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to only edge case scenarios."""
     return [s for s in synthetic_scenarios if s.get("category") == "edge_case"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def negative_scenarios(synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to only negative (violation) scenarios."""
     return [s for s in synthetic_scenarios if s.get("category") == "negative"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cross_border_scenarios(synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to only cross-border scenarios."""
     return [s for s in synthetic_scenarios if s.get("category") == "cross_border"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temporal_scenarios(synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to only temporal scenarios."""
     return [s for s in synthetic_scenarios if s.get("category") == "temporal"]
 
 
+@pytest.fixture(scope="session")
+def scenario_indices(synthetic_scenarios: list[dict[str, Any]]) -> SimpleNamespace:
+    """Sets of categories, instruments, activities and jurisdictions.
+
+    Built in a single pass over the synthetic scenarios.
+    """
+    categories: set[str] = set()
+    instruments: set[str] = set()
+    activities: set[str] = set()
+    jurisdictions: set[str] = set()
+    for s in synthetic_scenarios:
+        categories.add(s["category"])
+        instruments.add(s["instrument_type"])
+        activities.add(s["activity"])
+        if s.get("jurisdiction"):
+            jurisdictions.add(s["jurisdiction"])
+    return SimpleNamespace(
+        categories=categories,
+        instruments=instruments,
+        activities=activities,
+        jurisdictions=jurisdictions,
+    )
+
+
 # =============================================================================
 # Parametrized Scenario Fixture
 # =============================================================================
 
 
-@pytest.fixture(params=["happy_path", "edge_case", "negative", "cross_border", "temporal"])
+@pytest.fixture(scope="session", params=["happy_path", "edge_case", "negative", "cross_border", "temporal"])
 def scenario_category(request, synthetic_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Parametrized fixture for testing across all scenario categories."""
     return [s for s in synthetic_scenarios if s.get("category") == request.param]
@@ -196,25 +278,25 @@ def scenario_category(request, synthetic_scenarios: list[dict[str, Any]]) -> lis
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mica_rules(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to MiCA (EU) rules only."""
     return [r for r in synthetic_rules if r.get("framework") == "MiCA"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fca_rules(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to FCA (UK) rules only."""
     return [r for r in synthetic_rules if r.get("framework") == "FCA Crypto"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def genius_rules(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to GENIUS Act (US) rules only."""
     return [r for r in synthetic_rules if r.get("framework") == "GENIUS Act"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rwa_rules(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to RWA Tokenization rules only."""
     return [r for r in synthetic_rules if r.get("framework") == "RWA Tokenization"]
@@ -225,25 +307,85 @@ def rwa_rules(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tier0_verification(synthetic_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to Tier 0 (schema validation) evidence."""
     return [v for v in synthetic_verification if v.get("tier") == 0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tier1_verification(synthetic_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to Tier 1 (semantic consistency) evidence."""
     return [v for v in synthetic_verification if v.get("tier") == 1]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def passing_verification(synthetic_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to passing verification evidence."""
     return [v for v in synthetic_verification if v.get("outcome") == "passing"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_verification(synthetic_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter to failing verification evidence."""
     return [v for v in synthetic_verification if v.get("outcome") == "failing"]
+
+
+# =============================================================================
+# Sampled Fixtures
+# =============================================================================
+# Seeded random samples drawn once per session, so spot-check tests look at
+# records spread across each pool instead of always the first few.
+
+
+def _seeded_sample(items: list[dict[str, Any]], k: int = 10) -> list[dict[str, Any]]:
+    """Draw a reproducible sample of up to ``k`` items."""
+    return random.Random(0).sample(items, min(k, len(items)))
+
+
+@pytest.fixture(scope="session")
+def happy_path_sample(happy_path_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of happy path scenarios."""
+    return _seeded_sample(happy_path_scenarios)
+
+
+@pytest.fixture(scope="session")
+def negative_sample(negative_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of negative scenarios."""
+    return _seeded_sample(negative_scenarios)
+
+
+@pytest.fixture(scope="session")
+def cross_border_sample(cross_border_scenarios: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of cross-border scenarios."""
+    return _seeded_sample(cross_border_scenarios)
+
+
+@pytest.fixture(scope="session")
+def rules_sample(synthetic_rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of synthetic rules."""
+    return _seeded_sample(synthetic_rules)
+
+
+@pytest.fixture(scope="session")
+def verification_sample(synthetic_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of verification evidence across all tiers."""
+    return _seeded_sample(synthetic_verification, k=20)
+
+
+@pytest.fixture(scope="session")
+def tier0_sample(tier0_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of Tier 0 evidence."""
+    return _seeded_sample(tier0_verification)
+
+
+@pytest.fixture(scope="session")
+def passing_sample(passing_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of passing evidence."""
+    return _seeded_sample(passing_verification)
+
+
+@pytest.fixture(scope="session")
+def failing_sample(failing_verification: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sample of failing evidence."""
+    return _seeded_sample(failing_verification)
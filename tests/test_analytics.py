@@ -200,6 +200,18 @@ class TestErrorPatternAnalyzer:
         # keyword_overlap has 2 warnings
         assert any("keyword_overlap" in p for p in pattern_ids)
 
+    def test_detect_patterns_without_samples(self, rules_with_consistency):
+        """Test that sample collection can be skipped."""
+        analyzer = ErrorPatternAnalyzer()
+        with_samples = analyzer.detect_patterns(rules_with_consistency, min_affected=1)
+        without_samples = analyzer.detect_patterns(
+            rules_with_consistency, min_affected=1, include_samples=False
+        )
+
+        assert [p.pattern_id for p in without_samples] == [p.pattern_id for p in with_samples]
+        assert any(p.sample_evidence for p in with_samples)
+        assert all(p.sample_evidence == [] for p in without_samples)
+
     def test_build_review_queue(self, rules_with_consistency):
         """Test review queue construction."""
         analyzer = ErrorPatternAnalyzer()
@@ -248,6 +260,21 @@ class TestDriftDetector:
         assert metrics.unverified_count == 1
         assert metrics.avg_confidence > 0
 
+    def test_capture_metrics_category_scores(self, rules_with_consistency):
+        """Test per-category scores are averages over all evidence."""
+        detector = DriftDetector()
+        metrics = detector.capture_metrics(rules_with_consistency)
+
+        scores: dict[str, list[float]] = {}
+        for rule in rules_with_consistency:
+            if rule.consistency:
+                for ev in rule.consistency.evidence:
+                    scores.setdefault(ev.category, []).append(ev.score)
+
+        assert metrics.category_scores.keys() == scores.keys()
+        for cat, values in scores.items():
+            assert metrics.category_scores[cat] == pytest.approx(sum(values) / len(values), abs=1e-4)
+
     def test_set_baseline(self, rules_with_consistency):
         """Test baseline setting."""
         detector = DriftDetector()
@@ -695,6 +722,11 @@ class TestRuleAnalyticsService:
         )
 
         assert isinstance(result, ConflictReport)
+        assert (
+            result.high_severity_count
+            + result.medium_severity_count
+            + result.low_severity_count
+        ) == result.conflicts_found
 
     def test_find_similar_basic(self, analytics_service_with_rules):
         """Test basic similarity search."""
@@ -872,6 +904,25 @@ class TestRuleAnalyticsServiceEdgeCases:
         assert result.total_rules == 0
         assert result.total_legal_sources == 0
 
+    def test_mean_pairwise_cosine_matches_pairwise_loop(self):
+        """Test vectorized cohesion against the scalar cosine helper."""
+        import numpy as np
+        from backend.analytics.service import _cosine_similarity, _mean_pairwise_cosine
+
+        vectors = np.array([
+            [1.0, 0.0, 2.0],
+            [0.5, 1.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [3.0, 1.0, 1.0],
+        ])
+        pairwise = [
+            _cosine_similarity(vectors[i].tolist(), vectors[j].tolist())
+            for i in range(len(vectors))
+            for j in range(i + 1, len(vectors))
+        ]
+
+        assert _mean_pairwise_cosine(vectors) == pytest.approx(sum(pairwise) / len(pairwise))
+
 
 # =============================================================================
 # Analytics API Route Tests
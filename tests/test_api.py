@@ -1,45 +1,57 @@
 """Tests for FastAPI endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
 
-from backend.main import app
+# Share one worker (and one TestClient lifespan) under --dist=loadgroup.
+pytestmark = pytest.mark.xdist_group("api")
 
 
-@pytest.fixture
-def client():
-    """Test client for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="module", autouse=True)
+def _warm_rules(client):
+    """Load the rule registry once so endpoint tests never hit the cold path."""
+    client.post("/decide/reload")
 
 
 class TestRootEndpoints:
-    def test_root(self, client):
+    def test_root(self, client, read_json):
         response = client.get("/")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
         assert "name" in data
         assert "endpoints" in data
 
-    def test_health(self, client):
+    def test_health(self, client, read_json):
         response = client.get("/health")
         assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
+        assert read_json(response)["status"] == "healthy"
 
 
 class TestDecideEndpoint:
-    def test_decide_not_authorized(self, client):
+    # Decision outcomes per scenario are unit-tested against DecisionEngine in
+    # test_rules.py; these tests cover request parsing and response serialization.
+
+    @pytest.mark.parametrize(
+        "authorized,is_credit_institution,expected,min_obligations",
+        [
+            (False, False, "not_authorized", 1),
+            (True, False, "authorized", 0),
+        ],
+    )
+    def test_decide_authorization_outcomes(
+        self, client, read_json, authorized, is_credit_institution, expected, min_obligations
+    ):
         response = client.post(
             "/decide",
             json={
                 "instrument_type": "art",
                 "activity": "public_offer",
                 "jurisdiction": "EU",
-                "authorized": False,
-                "is_credit_institution": False,
+                "authorized": authorized,
+                "is_credit_institution": is_credit_institution,
             },
         )
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert "results" in data
         assert len(data["results"]) >= 1
@@ -50,52 +62,10 @@ class TestDecideEndpoint:
             None,
         )
         assert auth_result is not None
-        assert auth_result["decision"] == "not_authorized"
-        assert len(auth_result["obligations"]) >= 1
+        assert auth_result["decision"] == expected
+        assert len(auth_result["obligations"]) >= min_obligations
 
-    def test_decide_authorized(self, client):
-        response = client.post(
-            "/decide",
-            json={
-                "instrument_type": "art",
-                "activity": "public_offer",
-                "jurisdiction": "EU",
-                "authorized": True,
-                "is_credit_institution": False,
-            },
-        )
-        assert response.status_code == 200
-        data = response.json()
-
-        auth_result = next(
-            (r for r in data["results"] if "art36" in r["rule_id"]),
-            None,
-        )
-        assert auth_result is not None
-        assert auth_result["decision"] == "authorized"
-
-    def test_decide_exempt(self, client):
-        response = client.post(
-            "/decide",
-            json={
-                "instrument_type": "art",
-                "activity": "public_offer",
-                "jurisdiction": "EU",
-                "authorized": False,
-                "is_credit_institution": True,
-            },
-        )
-        assert response.status_code == 200
-        data = response.json()
-
-        auth_result = next(
-            (r for r in data["results"] if "art36" in r["rule_id"]),
-            None,
-        )
-        assert auth_result is not None
-        assert auth_result["decision"] == "exempt"
-
-    def test_decide_specific_rule(self, client):
+    def test_decide_specific_rule(self, client, read_json):
         response = client.post(
             "/decide",
             json={
@@ -107,12 +77,12 @@ class TestDecideEndpoint:
             },
         )
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert len(data["results"]) == 1
         assert data["results"][0]["rule_id"] == "mica_art36_public_offer_authorization"
 
-    def test_decide_includes_trace(self, client):
+    def test_decide_includes_trace_and_summary(self, client, read_json):
         response = client.post(
             "/decide",
             json={
@@ -123,7 +93,7 @@ class TestDecideEndpoint:
             },
         )
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         result = data["results"][0]
         assert "trace" in result
@@ -132,44 +102,31 @@ class TestDecideEndpoint:
         assert "condition" in result["trace"][0]
         assert "result" in result["trace"][0]
 
-    def test_decide_includes_summary(self, client):
-        response = client.post(
-            "/decide",
-            json={
-                "instrument_type": "art",
-                "activity": "public_offer",
-                "jurisdiction": "EU",
-                "authorized": False,
-            },
-        )
-        assert response.status_code == 200
-        data = response.json()
-
         assert "summary" in data
         assert data["summary"] is not None
 
 
 class TestRulesEndpoint:
-    def test_list_rules(self, client):
+    def test_list_rules(self, client, read_json):
         response = client.get("/rules")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert "rules" in data
         assert "total" in data
         assert data["total"] >= 2
 
-    def test_list_rules_with_tag(self, client):
+    def test_list_rules_with_tag(self, client, read_json):
         response = client.get("/rules?tag=authorization")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert all("authorization" in r["tags"] for r in data["rules"])
 
-    def test_get_rule_detail(self, client):
+    def test_get_rule_detail(self, client, read_json):
         response = client.get("/rules/mica_art36_public_offer_authorization")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert data["rule_id"] == "mica_art36_public_offer_authorization"
         assert "applies_if" in data
@@ -180,36 +137,36 @@ class TestRulesEndpoint:
         response = client.get("/rules/nonexistent_rule")
         assert response.status_code == 404
 
-    def test_list_tags(self, client):
+    def test_list_tags(self, client, read_json):
         response = client.get("/rules/tags/all")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert "tags" in data
         assert "mica" in data["tags"]
 
 
 class TestQAEndpoint:
-    def test_qa_status(self, client):
+    def test_qa_status(self, client, read_json):
         response = client.get("/qa/status")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert "documents_indexed" in data
         assert "vector_search_available" in data
 
-    def test_qa_ask_no_documents(self, client):
+    def test_qa_ask_no_documents(self, client, read_json):
         response = client.post(
             "/qa/ask",
             json={"question": "What is MiCA?"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert "answer" in data
         assert "sources" in data
 
-    def test_qa_index_document(self, client):
+    def test_qa_index_document(self, client, read_json):
         response = client.post(
             "/qa/index",
             json={
@@ -218,7 +175,7 @@ class TestQAEndpoint:
             },
         )
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert data["status"] == "indexed"
         assert data["document_id"] == "test_doc"
@@ -232,10 +189,10 @@ class TestQAEndpoint:
 
 
 class TestReloadEndpoint:
-    def test_reload_rules(self, client):
+    def test_reload_rules(self, client, read_json):
         response = client.post("/decide/reload")
         assert response.status_code == 200
-        data = response.json()
+        data = read_json(response)
 
         assert data["status"] == "reloaded"
-        assert data["rules_loaded"] >= 2
+        assert data["rules_loaded"] == read_json(client.get("/rules"))["total"]
@@ -114,6 +114,15 @@ class TestVerifyAllEndpoint:
         assert "results" in data
         assert isinstance(data["results"], list)
 
+    def test_verify_all_status_counts_match_results(self, client):
+        """Status counts agree with the per-rule results."""
+        response = client.post("/ke/verify-all?tiers=0&tiers=1")
+
+        data = response.json()
+        for status in ("verified", "needs_review", "inconsistent"):
+            expected = sum(1 for r in data["results"] if r["status"] == status)
+            assert data[status] == expected
+
     def test_verify_all_with_tier_filter(self, client):
         """Verify all with specific tiers."""
         response = client.post("/ke/verify-all?tiers=0")
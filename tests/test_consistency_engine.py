@@ -404,6 +404,29 @@ class TestSummaryComputation:
         summary = compute_summary(evidence)
         assert summary.status == ConsistencyStatus.NEEDS_REVIEW
 
+    def test_summary_label_counts(self):
+        """Summary carries pass/fail/warning counts from the evidence."""
+        from backend.rules import ConsistencyEvidence
+
+        evidence = [
+            ConsistencyEvidence(
+                tier=0, category="test1", label="pass", score=1.0, details="ok"
+            ),
+            ConsistencyEvidence(
+                tier=0, category="test2", label="fail", score=0.0, details="failed"
+            ),
+            ConsistencyEvidence(
+                tier=1, category="test3", label="warning", score=0.6, details="warn"
+            ),
+            ConsistencyEvidence(
+                tier=1, category="test4", label="pass", score=0.9, details="ok"
+            ),
+        ]
+        summary = compute_summary(evidence)
+        assert summary.pass_count == 2
+        assert summary.fail_count == 1
+        assert summary.warning_count == 1
+
     def test_summary_inconsistent_with_fail(self):
         """Summary is inconsistent when any check fails."""
         from backend.rules import ConsistencyEvidence
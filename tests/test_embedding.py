@@ -85,3 +85,38 @@ class TestEmbeddingRules:
         response = client.delete(f"/embedding/rules/{sample_rule_data['rule_id']}")
         assert response.status_code == 200
         assert response.json()["is_active"] is False
+
+
+class TestEmbeddingGenerator:
+    def test_falls_back_to_hash_when_import_fails(self, monkeypatch):
+        """An installed but unimportable sentence-transformers uses hash vectors."""
+        import sys
+        from backend.embeddings import generator
+
+        monkeypatch.setattr(generator, "_ml_available", True)
+        monkeypatch.setattr(generator, "_encoder", None)
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+
+        gen = generator.EmbeddingGenerator(use_ml=True)
+        vector = gen._encode("crypto-asset service provider")
+
+        assert len(vector) == generator.DEFAULT_DIM
+        assert gen.use_ml is False
+        assert gen.model_name == "hash-fallback"
+        assert generator.ml_available() is False
+
+    def test_encode_errors_propagate(self, monkeypatch):
+        """Errors raised by a working encoder are not swallowed by the fallback."""
+        from backend.embeddings import generator
+
+        class FailingEncoder:
+            def encode(self, text, convert_to_numpy=True):
+                raise RuntimeError("CUDA out of memory")
+
+        monkeypatch.setattr(generator, "_ml_available", True)
+        monkeypatch.setattr(generator, "_encoder", FailingEncoder())
+
+        gen = generator.EmbeddingGenerator(use_ml=True)
+        with pytest.raises(RuntimeError, match="out of memory"):
+            gen._encode("crypto-asset service provider")
+        assert gen.use_ml is True
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from backend.rag import frontend_helpers
 from backend.rag.frontend_helpers import (
     RuleContextPayload,
     RelatedProvision,
@@ -13,7 +14,9 @@ from backend.rag.frontend_helpers import (
     search_corpus,
     _parse_article_reference,
     _normalize_article,
+    _get_source_index,
 )
+from backend.rules import RuleLoader
 
 
 # =============================================================================
@@ -144,6 +147,35 @@ class TestGetRuleContext:
         assert isinstance(ctx.before, list)
         assert isinstance(ctx.after, list)
 
+    def test_context_memoized_until_rules_change(self, monkeypatch, rules_dir):
+        """Repeated lookups reuse the built payload until the loader changes."""
+        rule_id = "mica_art36_public_offer_authorization"
+        loader = RuleLoader(rules_dir)
+        loader.load_directory()
+
+        builds: list[str] = []
+
+        def fake_build(_loader, rid):
+            builds.append(rid)
+            return RuleContextPayload(
+                rule_id=rid, document_id="doc", article=None, section=None,
+                pages=None, primary_span="span", before=[], after=[],
+            )
+
+        monkeypatch.setattr(frontend_helpers, "_rule_loader", loader)
+        monkeypatch.setattr(frontend_helpers, "_cache_version", None)
+        monkeypatch.setattr(frontend_helpers, "_rule_context_cache", {})
+        monkeypatch.setattr(frontend_helpers, "_build_rule_context", fake_build)
+
+        ctx = get_rule_context(rule_id)
+        ctx.before.append("mutated")
+        assert get_rule_context(rule_id).before == []
+        assert builds == [rule_id]
+
+        loader.update_rule(rule_id, {})
+        get_rule_context(rule_id)
+        assert builds == [rule_id, rule_id]
+
 
 # =============================================================================
 # Related Provisions Tests
@@ -190,6 +222,15 @@ class TestGetRelatedProvisions:
         provisions = get_related_provisions("nonexistent_rule_xyz_12345")
         assert provisions == []
 
+    def test_repeated_calls_return_independent_lists(self):
+        """Cached results are returned as independent copies."""
+        first = get_related_provisions("mica_art36_public_offer_authorization", threshold=0.1)
+        expected_count = len(first)
+        first.clear()
+
+        second = get_related_provisions("mica_art36_public_offer_authorization", threshold=0.1)
+        assert len(second) == expected_count
+
     def test_provision_structure(self):
         """Verify RelatedProvision has expected fields."""
         provisions = get_related_provisions(
@@ -211,6 +252,34 @@ class TestGetRelatedProvisions:
             assert 0.0 <= provision.score <= 1.0
 
 
+# =============================================================================
+# Source Index Tests
+# =============================================================================
+
+
+class TestSourceIndex:
+    """Test the cached (document_id, article) -> rule_ids index."""
+
+    def test_index_rebuilt_after_rule_source_changes(self, monkeypatch, rules_dir):
+        """Updating a rule's source moves it to the new index key."""
+        rule_id = "mica_art36_public_offer_authorization"
+        loader = RuleLoader(rules_dir)
+        loader.load_directory()
+
+        monkeypatch.setattr(frontend_helpers, "_rule_loader", loader)
+        monkeypatch.setattr(frontend_helpers, "_source_index", None)
+
+        index = _get_source_index()
+        assert rule_id in index[("mica_2023", "36")]
+
+        source = loader.get_rule(rule_id).source.model_dump()
+        loader.update_rule(rule_id, {"source": {**source, "article": "99(2)"}})
+        index = _get_source_index()
+
+        assert rule_id not in index.get(("mica_2023", "36"), [])
+        assert index[("mica_2023", "99")] == [rule_id]
+
+
 # =============================================================================
 # Corpus Search Tests
 # =============================================================================
@@ -303,6 +303,18 @@ class TestRelatedRules:
         for related_rule in related:
             assert any(tag in rule.tags for tag in related_rule.tags)
 
+    def test_find_related_rules_sees_rule_updates(self, rule_loader):
+        """Test that cached rule features are refreshed after updates."""
+        retriever = RuleContextRetriever(rule_loader=rule_loader)
+        rule = rule_loader.get_rule("mica_art36_auth")
+
+        related_ids = [r.rule_id for r in retriever.find_related_rules(rule, top_k=5)]
+        assert "other_regulation_rule" not in related_ids
+
+        rule_loader.update_rule("other_regulation_rule", {"tags": ["authorization"]})
+        related_ids = [r.rule_id for r in retriever.find_related_rules(rule, top_k=5)]
+        assert "other_regulation_rule" in related_ids
+
     def test_find_related_rules_no_loader(self):
         """Test that no related rules returned without loader."""
         retriever = RuleContextRetriever()  # No rule_loader
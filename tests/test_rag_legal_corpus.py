@@ -56,8 +56,8 @@ class TestChunkLegalDocument:
         doc = load_legal_document("mica_2023")
         chunks = chunk_legal_document(doc)
 
-        ids = [c["id"] for c in chunks]
-        assert len(ids) == len(set(ids)), "Duplicate chunk IDs found"
+        ids = {c["id"] for c in chunks}
+        assert len(ids) == len(chunks), "Duplicate chunk IDs found"
 
 
 class TestIndexLegalCorpus:
@@ -103,6 +103,14 @@ class TestSearchLegalCorpus:
         ]
         assert len(mica_results) > 0
 
+    def test_search_results_sorted_by_score(self, indexed_bm25):
+        """Test that top-k results come back highest score first."""
+        results = indexed_bm25.search("authorization of crypto-asset service providers", top_k=8)
+
+        scores = [score for _, score in results]
+        assert len(scores) <= 8
+        assert scores == sorted(scores, reverse=True)
+
     def test_search_dlt_keyword(self, indexed_bm25):
         """Test searching for DLT Pilot-specific keyword."""
         results = indexed_bm25.search("DLT market infrastructure", top_k=5)
@@ -30,6 +30,20 @@ class TestRuleLoader:
         rules = rule_loader.get_all_rules()
         assert len(rules) >= 2
 
+    def test_version_bumps_on_changes(self, rules_dir: Path):
+        loader = RuleLoader()
+        assert loader.version == 0
+
+        loader.load_file(rules_dir / "mica_authorization.yaml")
+        loaded_version = loader.version
+        assert loaded_version > 0
+
+        loader.get_all_rules()
+        assert loader.version == loaded_version
+
+        loader.update_rule("mica_art36_public_offer_authorization", {"version": "2.0"})
+        assert loader.version == loaded_version + 1
+
     def test_rule_has_source(self, rule_loader: RuleLoader):
         rule = rule_loader.get_rule("mica_art36_public_offer_authorization")
         assert rule.source is not None
@@ -47,46 +61,35 @@ class TestRuleLoader:
 
 
 class TestDecisionEngine:
-    def test_evaluate_not_authorized(self, decision_engine: DecisionEngine):
+    @pytest.mark.parametrize(
+        "authorized,is_credit_institution,expected,expected_obligations",
+        [
+            (False, False, "not_authorized", 2),
+            (True, False, "authorized", 0),
+            (False, True, "exempt", None),
+        ],
+    )
+    def test_evaluate_authorization_outcomes(
+        self,
+        decision_engine: DecisionEngine,
+        authorized: bool,
+        is_credit_institution: bool,
+        expected: str,
+        expected_obligations: int | None,
+    ):
         scenario = Scenario(
             instrument_type="art",
             activity="public_offer",
             jurisdiction="EU",
-            authorized=False,
-            is_credit_institution=False,
-        )
-        result = decision_engine.evaluate(scenario, "mica_art36_public_offer_authorization")
-
-        assert result.applicable is True
-        assert result.decision == "not_authorized"
-        assert len(result.obligations) >= 1
-
-    def test_evaluate_authorized(self, decision_engine: DecisionEngine):
-        scenario = Scenario(
-            instrument_type="art",
-            activity="public_offer",
-            jurisdiction="EU",
-            authorized=True,
-            is_credit_institution=False,
-        )
-        result = decision_engine.evaluate(scenario, "mica_art36_public_offer_authorization")
-
-        assert result.applicable is True
-        assert result.decision == "authorized"
-        assert len(result.obligations) == 0
-
-    def test_evaluate_credit_institution_exempt(self, decision_engine: DecisionEngine):
-        scenario = Scenario(
-            instrument_type="art",
-            activity="public_offer",
-            jurisdiction="EU",
-            authorized=False,
-            is_credit_institution=True,
+            authorized=authorized,
+            is_credit_institution=is_credit_institution,
         )
         result = decision_engine.evaluate(scenario, "mica_art36_public_offer_authorization")
 
         assert result.applicable is True
-        assert result.decision == "exempt"
+        assert result.decision == expected
+        if expected_obligations is not None:
+            assert len(result.obligations) == expected_obligations
 
     def test_evaluate_not_applicable_wrong_jurisdiction(self, decision_engine: DecisionEngine):
         scenario = Scenario(
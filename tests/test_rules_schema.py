@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import pytest
 from pathlib import Path
 from datetime import date
@@ -39,6 +40,18 @@ class TestConsistencyModels:
         assert evidence.score == 1.0
         assert evidence.timestamp  # Should have default
 
+    def test_consistency_evidence_label_interned(self):
+        """Test that labels built at runtime are interned."""
+        runtime_label = "".join(["pa", "ss"])
+        evidence = ConsistencyEvidence(
+            tier=0,
+            category="schema_valid",
+            label=runtime_label,
+            score=1.0,
+            details="ok",
+        )
+        assert evidence.label is sys.intern("pass")
+
     def test_consistency_summary_defaults(self):
         """Test ConsistencySummary default values."""
         summary = ConsistencySummary()
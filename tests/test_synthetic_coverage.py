@@ -6,9 +6,11 @@ comprehensive test data covering all ontology dimensions and edge cases.
 Run with:
     pytest tests/test_synthetic_coverage.py -v
     pytest tests/test_synthetic_coverage.py -v --cov=backend/synthetic_data
+    pytest tests/ -n auto --dist=loadgroup
 """
 
 import pytest
+from collections import Counter
 from typing import Any
 
 from backend.synthetic_data import (
@@ -20,13 +22,14 @@ from backend.synthetic_data import (
     VERIFICATION_TIERS,
 )
 from backend.synthetic_data.config import (
-    INSTRUMENT_TYPES,
-    ACTIVITY_TYPES,
-    JURISDICTIONS,
     DECISION_OUTCOMES,
     CONFIDENCE_RANGES,
 )
 
+# Keep the module on one xdist worker so the session-scoped generator
+# fixtures are built once per worker rather than once per test slice.
+pytestmark = pytest.mark.xdist_group("synthetic")
+
 
 # =============================================================================
 # Scenario Generator Tests
@@ -51,54 +54,51 @@ class TestScenarioGenerator:
 
     def test_scenario_ids_are_unique(self, synthetic_scenarios):
         """All scenario IDs are unique."""
-        ids = [s["scenario_id"] for s in synthetic_scenarios]
-        assert len(ids) == len(set(ids)), "Duplicate scenario IDs found"
+        ids = {s["scenario_id"] for s in synthetic_scenarios}
+        assert len(ids) == len(synthetic_scenarios), "Duplicate scenario IDs found"
 
-    def test_all_categories_represented(self, synthetic_scenarios):
+    def test_all_categories_represented(self, scenario_indices):
         """All scenario categories are present."""
-        categories = set(s["category"] for s in synthetic_scenarios)
+        categories = scenario_indices.categories
         expected = set(SCENARIO_CATEGORIES.keys())
         assert categories == expected, f"Missing categories: {expected - categories}"
 
     def test_category_distribution(self, synthetic_scenarios):
         """Categories follow expected distribution."""
-        by_category = {}
-        for s in synthetic_scenarios:
-            cat = s["category"]
-            by_category[cat] = by_category.get(cat, 0) + 1
+        by_category = Counter(s["category"] for s in synthetic_scenarios)
 
         # Each category should have at least some scenarios
         for category in SCENARIO_CATEGORIES:
             assert by_category.get(category, 0) > 0, f"No scenarios for {category}"
 
-    def test_instrument_type_coverage(self, synthetic_scenarios):
+    def test_instrument_type_coverage(self, scenario_indices):
         """Scenarios cover all instrument types."""
-        instruments = set(s["instrument_type"] for s in synthetic_scenarios)
+        instruments = scenario_indices.instruments
         # Should cover at least the main instrument types
         main_instruments = {"art", "emt", "stablecoin", "utility_token"}
         assert main_instruments.issubset(instruments), f"Missing instruments: {main_instruments - instruments}"
 
-    def test_activity_coverage(self, synthetic_scenarios):
+    def test_activity_coverage(self, scenario_indices):
         """Scenarios cover core activities."""
-        activities = set(s["activity"] for s in synthetic_scenarios)
+        activities = scenario_indices.activities
         core_activities = {"public_offer", "admission_to_trading", "custody"}
         assert core_activities.issubset(activities), f"Missing activities: {core_activities - activities}"
 
-    def test_jurisdiction_coverage(self, synthetic_scenarios):
+    def test_jurisdiction_coverage(self, scenario_indices):
         """Scenarios cover main jurisdictions."""
-        jurisdictions = set(s.get("jurisdiction") for s in synthetic_scenarios if s.get("jurisdiction"))
+        jurisdictions = scenario_indices.jurisdictions
         main_jurisdictions = {"EU", "UK", "US"}
         assert main_jurisdictions.issubset(jurisdictions), f"Missing jurisdictions: {main_jurisdictions - jurisdictions}"
 
-    def test_happy_path_scenarios_are_compliant(self, happy_path_scenarios):
+    def test_happy_path_scenarios_are_compliant(self, happy_path_sample):
         """Happy path scenarios have compliant characteristics."""
-        for scenario in happy_path_scenarios[:10]:  # Sample
+        for scenario in happy_path_sample:
             assert scenario.get("authorized", False), f"Happy path should be authorized: {scenario['scenario_id']}"
             assert scenario.get("has_whitepaper", False), f"Happy path should have whitepaper: {scenario['scenario_id']}"
 
-    def test_negative_scenarios_have_violations(self, negative_scenarios):
+    def test_negative_scenarios_have_violations(self, negative_sample):
         """Negative scenarios have violation characteristics."""
-        for scenario in negative_scenarios[:10]:  # Sample
+        for scenario in negative_sample:
             assert "violation_type" in scenario, f"Negative should have violation_type: {scenario['scenario_id']}"
 
     def test_edge_cases_have_threshold_values(self, edge_case_scenarios):
@@ -111,25 +111,13 @@ class TestScenarioGenerator:
         # Should test multiple different thresholds
         assert len(threshold_tested) >= 3, f"Only tested {len(threshold_tested)} thresholds"
 
-    def test_cross_border_have_multiple_jurisdictions(self, cross_border_scenarios):
+    def test_cross_border_have_multiple_jurisdictions(self, cross_border_sample):
         """Cross-border scenarios involve multiple jurisdictions."""
-        for scenario in cross_border_scenarios[:10]:  # Sample
+        for scenario in cross_border_sample:
             assert scenario.get("is_cross_border", False), "Should be marked cross-border"
             targets = scenario.get("target_jurisdictions", [])
             assert len(targets) >= 1, f"Should have target jurisdictions: {scenario['scenario_id']}"
 
-    def test_deterministic_with_seed(self):
-        """Same seed produces same scenarios."""
-        gen1 = ScenarioGenerator(seed=123)
-        gen2 = ScenarioGenerator(seed=123)
-
-        scenarios1 = gen1.generate(count=10)
-        scenarios2 = gen2.generate(count=10)
-
-        for s1, s2 in zip(scenarios1, scenarios2):
-            assert s1["scenario_id"] == s2["scenario_id"]
-            assert s1["category"] == s2["category"]
-
     def test_validate_method(self):
         """Validate method correctly identifies valid scenarios."""
         generator = ScenarioGenerator(seed=42)
@@ -166,22 +154,19 @@ class TestRuleGenerator:
 
     def test_rule_ids_are_unique(self, synthetic_rules):
         """All rule IDs are unique."""
-        ids = [r["rule_id"] for r in synthetic_rules]
-        assert len(ids) == len(set(ids)), "Duplicate rule IDs found"
+        ids = {r["rule_id"] for r in synthetic_rules}
+        assert len(ids) == len(synthetic_rules), "Duplicate rule IDs found"
 
     def test_framework_distribution(self, synthetic_rules):
         """Rules are distributed across frameworks."""
-        by_framework = {}
-        for rule in synthetic_rules:
-            fw = rule.get("framework", "unknown")
-            by_framework[fw] = by_framework.get(fw, 0) + 1
+        by_framework = Counter(rule.get("framework", "unknown") for rule in synthetic_rules)
 
         # Should have rules from multiple frameworks
         assert len(by_framework) >= 2, f"Only {len(by_framework)} frameworks represented"
 
-    def test_decision_tree_structure(self, synthetic_rules):
+    def test_decision_tree_structure(self, rules_sample):
         """Decision trees have valid structure."""
-        for rule in synthetic_rules[:10]:  # Sample
+        for rule in rules_sample:
             tree = rule.get("decision_tree", {})
             assert "node_id" in tree, f"Tree missing node_id: {rule['rule_id']}"
             # Should have either condition or decision
@@ -254,15 +239,12 @@ class TestVerificationGenerator:
 
     def test_evidence_ids_are_unique(self, synthetic_verification):
         """All evidence IDs are unique."""
-        ids = [e["evidence_id"] for e in synthetic_verification]
-        assert len(ids) == len(set(ids)), "Duplicate evidence IDs found"
+        ids = {e["evidence_id"] for e in synthetic_verification}
+        assert len(ids) == len(synthetic_verification), "Duplicate evidence IDs found"
 
     def test_tier_distribution(self, synthetic_verification):
         """Evidence is distributed across tiers."""
-        by_tier = {}
-        for record in synthetic_verification:
-            tier = record.get("tier", -1)
-            by_tier[tier] = by_tier.get(tier, 0) + 1
+        by_tier = Counter(record.get("tier", -1) for record in synthetic_verification)
 
         # Should have all tiers represented
         assert set(by_tier.keys()) == set(VERIFICATION_TIERS.keys()), "Missing tiers"
@@ -273,9 +255,9 @@ class TestVerificationGenerator:
             score = record.get("confidence_score", 0)
             assert 0 <= score <= 1, f"Invalid confidence score: {score}"
 
-    def test_outcome_matches_confidence(self, synthetic_verification):
+    def test_outcome_matches_confidence(self, verification_sample):
         """Outcome label matches confidence score range."""
-        for record in synthetic_verification[:20]:  # Sample
+        for record in verification_sample:
             score = record.get("confidence_score", 0)
             outcome = record.get("outcome", "")
 
@@ -284,23 +266,23 @@ class TestVerificationGenerator:
             elif outcome == "failing":
                 assert score <= CONFIDENCE_RANGES["failing"][1], f"Failing score too high: {score}"
 
-    def test_tier0_is_schema_validation(self, tier0_verification):
+    def test_tier0_is_schema_validation(self, tier0_sample):
         """Tier 0 evidence is schema validation."""
-        for record in tier0_verification[:10]:  # Sample
+        for record in tier0_sample:
             assert record.get("tier_name") == "Schema validation"
             check_type = record.get("check_type", "")
             expected_types = VERIFICATION_TIERS[0]["check_types"]
             assert check_type in expected_types, f"Unexpected check type for tier 0: {check_type}"
 
-    def test_passing_evidence_has_high_score(self, passing_verification):
+    def test_passing_evidence_has_high_score(self, passing_sample):
         """Passing evidence has high confidence scores."""
-        for record in passing_verification[:10]:  # Sample
+        for record in passing_sample:
             score = record.get("confidence_score", 0)
             assert score >= 0.85, f"Passing evidence should have score >= 0.85: {score}"
 
-    def test_failing_evidence_has_low_score(self, failing_verification):
+    def test_failing_evidence_has_low_score(self, failing_sample):
         """Failing evidence has low confidence scores."""
-        for record in failing_verification[:10]:  # Sample
+        for record in failing_sample:
             score = record.get("confidence_score", 0)
             assert score < 0.70, f"Failing evidence should have score < 0.70: {score}"
 
@@ -331,46 +313,43 @@ class TestVerificationGenerator:
 class TestCrossGeneratorIntegration:
     """Tests for integration between generators."""
 
-    def test_scenario_instrument_types_match_ontology(self, synthetic_scenarios):
+    def test_scenario_instrument_types_match_ontology(self, scenario_indices, ontology_sets):
         """Scenario instrument types match defined ontology."""
-        for scenario in synthetic_scenarios:
-            instrument = scenario.get("instrument_type")
-            assert instrument in INSTRUMENT_TYPES, f"Unknown instrument type: {instrument}"
+        unknown = scenario_indices.instruments - ontology_sets.instruments
+        assert not unknown, f"Unknown instrument types: {sorted(unknown)}"
 
-    def test_scenario_activities_match_ontology(self, synthetic_scenarios):
+    def test_scenario_activities_match_ontology(self, scenario_indices, ontology_sets):
         """Scenario activities match defined ontology."""
-        for scenario in synthetic_scenarios:
-            activity = scenario.get("activity")
-            assert activity in ACTIVITY_TYPES, f"Unknown activity type: {activity}"
+        unknown = scenario_indices.activities - ontology_sets.activities
+        assert not unknown, f"Unknown activity types: {sorted(unknown)}"
 
-    def test_rule_jurisdictions_match_ontology(self, synthetic_rules):
+    def test_rule_jurisdictions_match_ontology(self, synthetic_rules, ontology_sets):
         """Rule jurisdictions match defined ontology."""
         for rule in synthetic_rules:
             jurisdiction = rule.get("jurisdiction")
-            assert jurisdiction in JURISDICTIONS, f"Unknown jurisdiction: {jurisdiction}"
+            assert jurisdiction in ontology_sets.jurisdictions, f"Unknown jurisdiction: {jurisdiction}"
 
-    def test_verification_tiers_match_config(self, synthetic_verification):
+    def test_verification_tiers_match_config(self, synthetic_verification, ontology_sets):
         """Verification tiers match configuration."""
         for record in synthetic_verification:
             tier = record.get("tier")
-            assert tier in VERIFICATION_TIERS, f"Unknown tier: {tier}"
-
-    def test_all_generators_deterministic(self):
-        """All generators produce deterministic output with same seed."""
-        seed = 999
-
-        # Generate twice with same seed
-        scenarios1 = ScenarioGenerator(seed=seed).generate(5)
-        scenarios2 = ScenarioGenerator(seed=seed).generate(5)
-        assert [s["scenario_id"] for s in scenarios1] == [s["scenario_id"] for s in scenarios2]
-
-        rules1 = RuleGenerator(seed=seed).generate(5)
-        rules2 = RuleGenerator(seed=seed).generate(5)
-        assert [r["rule_id"] for r in rules1] == [r["rule_id"] for r in rules2]
-
-        evidence1 = VerificationGenerator(seed=seed).generate(5)
-        evidence2 = VerificationGenerator(seed=seed).generate(5)
-        assert [e["evidence_id"] for e in evidence1] == [e["evidence_id"] for e in evidence2]
+            assert tier in ontology_sets.tiers, f"Unknown tier: {tier}"
+
+    @pytest.mark.parametrize(
+        "generator_cls,id_key",
+        [
+            (ScenarioGenerator, "scenario_id"),
+            (RuleGenerator, "rule_id"),
+            (VerificationGenerator, "evidence_id"),
+        ],
+    )
+    def test_generator_determinism(self, generator_cls, id_key):
+        """Each generator produces the same IDs for the same seed."""
+        # Two fresh instances: a cached run would make the comparison trivial.
+        # IDs carry the category prefix, so this also pins category order.
+        first = generator_cls(seed=999).generate(10)
+        second = generator_cls(seed=999).generate(10)
+        assert [r[id_key] for r in first] == [r[id_key] for r in second]
 
 
 # =============================================================================
@@ -406,10 +385,7 @@ class TestCoverageMetrics:
 
     def test_verification_outcome_distribution(self, synthetic_verification):
         """Verification outcomes follow expected distribution."""
-        by_outcome = {}
-        for record in synthetic_verification:
-            outcome = record.get("outcome", "unknown")
-            by_outcome[outcome] = by_outcome.get(outcome, 0) + 1
+        by_outcome = Counter(record.get("outcome", "unknown") for record in synthetic_verification)
 
         total = len(synthetic_verification)
         passing_pct = by_outcome.get("passing", 0) / total
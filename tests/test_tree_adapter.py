@@ -208,6 +208,29 @@ class TestTreeAdapter:
         assert len(graph.nodes) == 1
         assert graph.nodes[0].decision == "undefined"
 
+    def test_convert_sets_short_labels(self, nested_rule: Rule) -> None:
+        """Test that short labels are precomputed for every node."""
+        adapter = TreeAdapter()
+        graph = adapter.convert(nested_rule)
+
+        labels = {n.id: n.short_label for n in graph.nodes}
+        assert labels["root"] == "root"
+        assert labels["branch_1"] == "branch_1"
+
+        leaf_labels = {n.short_label for n in graph.nodes if n.node_type == "leaf"}
+        assert leaf_labels == {"authorized", "restricted", "not_authorized"}
+        assert all(len(label) <= 15 for label in labels.values())
+
+    def test_short_label_defaults_on_direct_construction(self) -> None:
+        """Test that directly built nodes derive their short label."""
+        leaf = TreeNode(id="leaf_1", node_type="leaf", label="x", decision="conditionally_authorized")
+        branch = TreeNode(id="branch_with_a_long_id", node_type="branch", label="x")
+        explicit = TreeNode(id="n", node_type="leaf", label="x", short_label="custom")
+
+        assert leaf.short_label == "conditionally_a"
+        assert branch.short_label == "branch_with_a_l"
+        assert explicit.short_label == "custom"
+
     def test_convert_with_consistency(self, rule_with_consistency: Rule) -> None:
         """Test converting a rule with consistency metadata."""
         adapter = TreeAdapter()